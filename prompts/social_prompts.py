@@ -37,7 +37,7 @@ Analyze the request and provide a structured response with:
 - additional_requirements: Any special requirements or constraints
 
 Response Format:
-{
+{{
     "intent_summary": "...",
     "platforms": ["platform1", "platform2"],
     "audience": "...",
@@ -47,7 +47,7 @@ Response Format:
     "cta": "...",
     "urgency": "...",
     "additional_requirements": "..."
-}
+}}
 """
 
 # Content Generation Prompt
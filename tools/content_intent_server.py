@@ -5,12 +5,16 @@ This MCP server provides AI-powered content intent analysis for social media man
 It analyzes user requests to understand content goals, target platforms, audience, and requirements.
 """
 
-import os
+import re
 import json
 import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional, Sequence
+import time
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime
+from types import MappingProxyType
 
 # MCP Server imports
 from mcp.server import Server
@@ -23,10 +27,88 @@ from mcp.types import (
     LoggingLevel
 )
 
-# Import social media prompts
-import sys
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from prompts.social_prompts import CONTENT_INTENT_ANALYSIS_PROMPT
+logger = logging.getLogger(__name__)
+
+# Keyword -> (analysis field, value) table for the keyword-based intent analysis
+_INTENT_KEYWORDS = {
+    "twitter": ("platforms", "twitter"),
+    "tweet": ("platforms", "twitter"),
+    "instagram": ("platforms", "instagram"),
+    "insta": ("platforms", "instagram"),
+    "linkedin": ("platforms", "linkedin"),
+    "facebook": ("platforms", "facebook"),
+    "fb": ("platforms", "facebook"),
+    "youtube": ("platforms", "youtube"),
+    "video": ("platforms", "youtube"),
+    "thread": ("content_type", "Twitter thread"),
+    "reel": ("content_type", "Short video/Reel"),
+    "short video": ("content_type", "Short video/Reel"),
+    "story": ("content_type", "Story"),
+    "post": ("content_type", "Social media post"),
+    "casual": ("tone", "Casual"),
+    "friendly": ("tone", "Casual"),
+    "professional": ("tone", "Professional"),
+    "business": ("tone", "Professional"),
+    "humorous": ("tone", "Humorous"),
+    "funny": ("tone", "Humorous"),
+    "urgent": ("urgency", "High"),
+    "asap": ("urgency", "High"),
+    "immediately": ("urgency", "High"),
+    "schedule": ("urgency", "Scheduled"),
+    "later": ("urgency", "Scheduled"),
+}
+
+# Field values in order of precedence when several keywords for a field match
+_INTENT_PRECEDENCE = {
+    "platforms": ("twitter", "instagram", "linkedin", "facebook", "youtube"),
+    "content_type": ("Twitter thread", "Short video/Reel", "Story", "Social media post"),
+    "tone": ("Casual", "Professional", "Humorous"),
+    "urgency": ("High", "Scheduled"),
+}
+
+# Single pass over the lowercased request; the lookahead also reports
+# overlapping keywords (e.g. "video" inside "short video")
+_INTENT_KEYWORD_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(k) for k in sorted(_INTENT_KEYWORDS, key=len, reverse=True))
+    + "))"
+)
+
+# Maximum number of users whose learned preferences are kept in memory
+_USER_PREFERENCES_SIZE = 10_000
+
+# Platform-specific hashtags appended by _generate_hashtags
+_PLATFORM_HASHTAGS = MappingProxyType({
+    "twitter": ("#Twitter", "#SocialMedia"),
+    "instagram": ("#Instagram", "#InstaDaily"),
+    "linkedin": ("#LinkedIn", "#Professional"),
+    "facebook": ("#Facebook", "#Community"),
+    "youtube": ("#YouTube", "#Video")
+})
+
+# Basic content templates used by _generate_content_ideas
+_IDEA_TEMPLATES = (
+    "Sharing insights about {} and its impact on our industry",
+    "What I've learned about {} recently",
+    "Thoughts on {} and future trends",
+    "Quick tip: {} best practices",
+    "Question: What's your experience with {}?"
+)
+
+# Translation table stripping whitespace from hashtag topics
+_HASHTAG_WHITESPACE = str.maketrans("", "", " \t\n\r")
+
+# Last (epoch second, ISO string) pair produced by _now_iso
+_last_timestamp = (0, "")
+
+
+def _now_iso() -> str:
+    """Return the current local time as an ISO string, cached per second"""
+    global _last_timestamp
+    second = int(time.time())
+    if _last_timestamp[0] != second:
+        _last_timestamp = (second, datetime.fromtimestamp(second).isoformat())
+    return _last_timestamp[1]
 
 
 class ContentIntentServer:
@@ -42,10 +124,10 @@ class ContentIntentServer:
 
     def __init__(self):
         self.server = Server("content-intent-server")
-        self.logger = logging.getLogger(__name__)
 
-        # User preference learning (would be stored in database)
-        self.user_preferences = {}
+        # User preference learning (would be stored in database), kept as an
+        # LRU bounded by _USER_PREFERENCES_SIZE
+        self.user_preferences = OrderedDict()
 
     async def analyze_intent(self, user_request: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -58,122 +140,82 @@ class ContentIntentServer:
         Returns:
             Intent analysis results
         """
+        timestamp = _now_iso()
+
         try:
-            # Prepare context for analysis
-            conversation_history = ""
-            platform_context = ""
-
-            if context:
-                if context.get("conversation_history"):
-                    # Format conversation history
-                    history_items = context["conversation_history"][-5:]  # Last 5 messages
-                    conversation_history = "\n".join([
-                        f"User: {msg.get('user', '')}\nAssistant: {msg.get('assistant', '')}"
-                        for msg in history_items
-                    ])
-
-                if context.get("platform_status"):
-                    # Format platform connection status
-                    connected_platforms = [
-                        platform for platform, status in context["platform_status"].items()
-                        if status.get("connected", False)
-                    ]
-                    platform_context = f"Connected platforms: {', '.join(connected_platforms)}"
-
-            # Format the analysis prompt
-            prompt = CONTENT_INTENT_ANALYSIS_PROMPT.format(
-                user_request=user_request,
-                conversation_history=conversation_history,
-                platform_context=platform_context
-            )
-
-            # In a real implementation, this would call an AI model
-            # For now, return a structured analysis
-            intent_analysis = await self._perform_intent_analysis(prompt)
+            # The keyword analysis only depends on the request itself;
+            # conversation history and platform status are reserved for the
+            # AI-backed analysis (see prompts/social_prompts.py)
+            intent_analysis = self._perform_intent_analysis(user_request)
 
             return {
                 "success": True,
                 "intent_analysis": intent_analysis,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
         except Exception as e:
-            self.logger.error(f"Error analyzing intent: {str(e)}")
+            logger.error(f"Error analyzing intent: {str(e)}")
             return {
                 "success": False,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
-    async def _perform_intent_analysis(self, prompt: str) -> Dict[str, Any]:
+    @staticmethod
+    def _perform_intent_analysis(user_request: str) -> Dict[str, Any]:
         """
         Perform the actual intent analysis using AI
 
         Args:
-            prompt: Formatted analysis prompt
+            user_request: The user's natural language request
 
         Returns:
-            Structured intent analysis
+            Structured intent analysis, freshly built for each call
         """
+        return {
+            field: list(value) if isinstance(value, tuple) else value
+            for field, value in ContentIntentServer._analyze_keywords(user_request)
+        }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _analyze_keywords(user_request: str) -> Tuple[Tuple[str, Any], ...]:
+        """Memoized keyword analysis as immutable (field, value) pairs"""
         # This is a simplified implementation
         # In a real system, this would call an AI model (Claude, GPT, etc.)
 
-        # Extract basic information from the prompt
-        prompt_lower = prompt.lower()
-
         # Default analysis structure
         analysis = {
             "intent_summary": "Create social media content",
-            "platforms": ["twitter"],
+            "platforms": ("twitter",),
             "audience": "General audience",
             "content_type": "Social media post",
             "tone": "Professional",
-            "topics": [],
+            "topics": (),
             "cta": "",
             "urgency": "Normal",
             "additional_requirements": ""
         }
 
         # Simple keyword-based analysis (would be replaced with AI)
-        if "twitter" in prompt_lower or "tweet" in prompt_lower:
-            analysis["platforms"].append("twitter")
-        if "instagram" in prompt_lower or "insta" in prompt_lower:
-            analysis["platforms"].append("instagram")
-        if "linkedin" in prompt_lower:
-            analysis["platforms"].append("linkedin")
-        if "facebook" in prompt_lower or "fb" in prompt_lower:
-            analysis["platforms"].append("facebook")
-        if "youtube" in prompt_lower or "video" in prompt_lower:
-            analysis["platforms"].append("youtube")
-
-        # Remove duplicates
-        analysis["platforms"] = list(set(analysis["platforms"]))
-
-        # Determine content type
-        if "thread" in prompt_lower:
-            analysis["content_type"] = "Twitter thread"
-        elif "reel" in prompt_lower or "short video" in prompt_lower:
-            analysis["content_type"] = "Short video/Reel"
-        elif "story" in prompt_lower:
-            analysis["content_type"] = "Story"
-        elif "post" in prompt_lower:
-            analysis["content_type"] = "Social media post"
-
-        # Determine tone
-        if "casual" in prompt_lower or "friendly" in prompt_lower:
-            analysis["tone"] = "Casual"
-        elif "professional" in prompt_lower or "business" in prompt_lower:
-            analysis["tone"] = "Professional"
-        elif "humorous" in prompt_lower or "funny" in prompt_lower:
-            analysis["tone"] = "Humorous"
-
-        # Determine urgency
-        if "urgent" in prompt_lower or "asap" in prompt_lower or "immediately" in prompt_lower:
-            analysis["urgency"] = "High"
-        elif "schedule" in prompt_lower or "later" in prompt_lower:
-            analysis["urgency"] = "Scheduled"
-
-        return analysis
+        matched = {}
+        for match in _INTENT_KEYWORD_RE.finditer(user_request.lower()):
+            field, value = _INTENT_KEYWORDS[match.group(1)]
+            matched.setdefault(field, set()).add(value)
+
+        # Matched platforms replace the default, in a stable order
+        platforms = matched.get("platforms")
+        if platforms:
+            analysis["platforms"] = tuple(p for p in _INTENT_PRECEDENCE["platforms"] if p in platforms)
+
+        # Determine content type, tone and urgency
+        for field in ("content_type", "tone", "urgency"):
+            values = matched.get(field)
+            if values:
+                analysis[field] = next(v for v in _INTENT_PRECEDENCE[field] if v in values)
+
+        return tuple(analysis.items())
 
     async def learn_user_preferences(self, user_id: str, intent_history: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -186,6 +228,8 @@ class ContentIntentServer:
         Returns:
             Learned user preferences
         """
+        timestamp = _now_iso()
+
         try:
             if user_id not in self.user_preferences:
                 self.user_preferences[user_id] = {
@@ -195,44 +239,47 @@ class ContentIntentServer:
                     "common_topics": [],
                     "posting_patterns": {}
                 }
+                # Evict the least recently seen users once the cap is exceeded
+                while len(self.user_preferences) > _USER_PREFERENCES_SIZE:
+                    self.user_preferences.popitem(last=False)
+            else:
+                self.user_preferences.move_to_end(user_id)
 
             preferences = self.user_preferences[user_id]
 
             if intent_history:
-                # Analyze history to learn preferences
-                platforms = []
-                tones = []
-                content_types = []
-                topics = []
+                # Analyze history to learn preferences in a single pass
+                platform_counts = Counter()
+                tone_counts = Counter()
+                content_type_counts = Counter()
+                topic_counts = Counter()
 
                 for intent in intent_history[-20:]:  # Last 20 analyses
-                    platforms.extend(intent.get("platforms", []))
-                    tones.append(intent.get("tone", ""))
-                    content_types.append(intent.get("content_type", ""))
-                    topics.extend(intent.get("topics", []))
+                    platform_counts.update(intent.get("platforms", ()))
+                    tone_counts[intent.get("tone", "")] += 1
+                    content_type_counts[intent.get("content_type", "")] += 1
+                    topic_counts.update(intent.get("topics", ()))
 
                 # Update preferences with most common values
-                from collections import Counter
-
-                preferences["preferred_platforms"] = [p for p, _ in Counter(platforms).most_common(3)]
-                preferences["common_tones"] = [t for t, _ in Counter(tones).most_common(2)]
-                preferences["preferred_content_types"] = [ct for ct, _ in Counter(content_types).most_common(2)]
-                preferences["common_topics"] = [t for t, _ in Counter(topics).most_common(5)]
+                preferences["preferred_platforms"] = [p for p, _ in platform_counts.most_common(3)]
+                preferences["common_tones"] = [t for t, _ in tone_counts.most_common(2)]
+                preferences["preferred_content_types"] = [ct for ct, _ in content_type_counts.most_common(2)]
+                preferences["common_topics"] = [t for t, _ in topic_counts.most_common(5)]
 
             return {
                 "success": True,
                 "user_id": user_id,
                 "preferences": preferences,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
         except Exception as e:
-            self.logger.error(f"Error learning user preferences: {str(e)}")
+            logger.error(f"Error learning user preferences: {str(e)}")
             return {
                 "success": False,
                 "user_id": user_id,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
     async def get_content_suggestions(self, user_id: str, topic: str, platform: str) -> Dict[str, Any]:
@@ -247,15 +294,19 @@ class ContentIntentServer:
         Returns:
             Personalized content suggestions
         """
+        timestamp = _now_iso()
+
         try:
             preferences = self.user_preferences.get(user_id, {})
+            if preferences:
+                self.user_preferences.move_to_end(user_id)
 
             # Generate suggestions based on preferences
             suggestions = {
                 "topic": topic,
                 "platform": platform,
                 "suggested_content": [],
-                "recommended_tone": preferences.get("common_tones", ["Professional"])[0],
+                "recommended_tone": (preferences.get("common_tones") or ["Professional"])[0],
                 "suggested_hashtags": self._generate_hashtags(topic, platform),
                 "personalization_notes": "Based on your posting history and preferences"
             }
@@ -267,66 +318,62 @@ class ContentIntentServer:
             return {
                 "success": True,
                 "suggestions": suggestions,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
         except Exception as e:
-            self.logger.error(f"Error generating content suggestions: {str(e)}")
+            logger.error(f"Error generating content suggestions: {str(e)}")
             return {
                 "success": False,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
-    def _generate_hashtags(self, topic: str, platform: str) -> List[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _generate_hashtags(topic: str, platform: str) -> Tuple[str, ...]:
         """Generate relevant hashtags for topic and platform"""
-        base_hashtags = [f"#{topic.replace(' ', '')}", f"#{topic.replace(' ', '').lower()}"]
+        stripped = topic.translate(_HASHTAG_WHITESPACE)
+        base_hashtags = (f"#{stripped}", f"#{stripped.lower()}")
 
         # Platform-specific hashtags
-        platform_hashtags = {
-            "twitter": ["#Twitter", "#SocialMedia"],
-            "instagram": ["#Instagram", "#InstaDaily"],
-            "linkedin": ["#LinkedIn", "#Professional"],
-            "facebook": ["#Facebook", "#Community"],
-            "youtube": ["#YouTube", "#Video"]
-        }
-
-        base_hashtags.extend(platform_hashtags.get(platform, []))
-        return base_hashtags[:5]  # Limit to 5 hashtags
+        hashtags = base_hashtags + _PLATFORM_HASHTAGS.get(platform, ())
+        return hashtags[:5]  # Limit to 5 hashtags
 
     def _generate_content_ideas(self, topic: str, platform: str, preferences: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate content ideas based on preferences"""
-        ideas = []
-
-        # Basic content templates
-        templates = [
-            f"Sharing insights about {topic} and its impact on our industry",
-            f"What I've learned about {topic} recently",
-            f"Thoughts on {topic} and future trends",
-            f"Quick tip: {topic} best practices",
-            f"Question: What's your experience with {topic}?"
-        ]
+        preferred_tone = (preferences.get("common_tones") or ["Professional"])[0]
+        hashtags = self._generate_hashtags(topic, platform)
 
-        preferred_tone = preferences.get("common_tones", ["Professional"])[0]
-
-        for i, template in enumerate(templates):
-            idea = {
+        return [
+            {
                 "id": f"idea_{i+1}",
-                "content": template,
+                "content": template.format(topic),
                 "tone": preferred_tone,
                 "estimated_engagement": "Medium",
-                "hashtags": self._generate_hashtags(topic, platform)
+                "hashtags": hashtags
             }
-            ideas.append(idea)
+            for i, template in enumerate(_IDEA_TEMPLATES)
+        ]
+
 
-        return ideas
+# Shared server instance so learned preferences persist across tool calls
+_server: Optional[ContentIntentServer] = None
+
+
+def _get_server() -> ContentIntentServer:
+    """Return the shared ContentIntentServer, creating it on first use"""
+    global _server
+    if _server is None:
+        _server = ContentIntentServer()
+    return _server
 
 
 # MCP Server Tool Handlers
 
 async def handle_analyze_intent(arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle analyze_intent tool call"""
-    server = ContentIntentServer()
+    server = _get_server()
 
     user_request = arguments.get("user_request", "")
     context = arguments.get("context", {})
@@ -335,13 +382,13 @@ async def handle_analyze_intent(arguments: Dict[str, Any]) -> List[TextContent]:
 
     return [TextContent(
         type="text",
-        text=json.dumps(result, indent=2)
+        text=json.dumps(result, separators=(",", ":"), ensure_ascii=False)
     )]
 
 
 async def handle_learn_preferences(arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle learn_preferences tool call"""
-    server = ContentIntentServer()
+    server = _get_server()
 
     user_id = arguments.get("user_id", "")
     intent_history = arguments.get("intent_history", [])
@@ -350,13 +397,13 @@ async def handle_learn_preferences(arguments: Dict[str, Any]) -> List[TextConten
 
     return [TextContent(
         type="text",
-        text=json.dumps(result, indent=2)
+        text=json.dumps(result, separators=(",", ":"), ensure_ascii=False)
     )]
 
 
 async def handle_get_suggestions(arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle get_suggestions tool call"""
-    server = ContentIntentServer()
+    server = _get_server()
 
     user_id = arguments.get("user_id", "")
     topic = arguments.get("topic", "")
@@ -366,12 +413,12 @@ async def handle_get_suggestions(arguments: Dict[str, Any]) -> List[TextContent]
 
     return [TextContent(
         type="text",
-        text=json.dumps(result, indent=2)
+        text=json.dumps(result, separators=(",", ":"), ensure_ascii=False)
     )]
 
 
 # Tool definitions for MCP
-CONTENT_INTENT_TOOLS = [
+CONTENT_INTENT_TOOLS = (
     Tool(
         name="analyze_intent",
         description="Analyze user request to understand content intent and requirements",
@@ -443,7 +490,7 @@ CONTENT_INTENT_TOOLS = [
             "required": ["user_id", "topic", "platform"]
         }
     )
-]
+)
 
 
 if __name__ == "__main__":
@@ -15,9 +15,16 @@ import os
 import json
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # MCP Server imports
 from mcp.server import Server
 from mcp.types import (
@@ -44,6 +51,33 @@ from models.social_models import (
     MediaAsset
 )
 
+# Supported platforms, as a tuple for iteration and a set for membership checks
+_PLATFORMS = ("twitter", "instagram", "linkedin", "facebook", "youtube")
+_PLATFORM_SET = frozenset(_PLATFORMS)
+
+# API client class for each supported platform
+_PLATFORM_CTORS = {
+    "twitter": TwitterClient,
+    "instagram": InstagramClient,
+    "linkedin": LinkedInClient,
+    "facebook": FacebookClient,
+    "youtube": YouTubeClient
+}
+
+
+class PlatformStatus:
+    """Connection status row for a single platform"""
+
+    __slots__ = ("connected", "last_check")
+
+    def __init__(self, connected: bool = False, last_check: Optional[str] = None):
+        self.connected = connected
+        self.last_check = last_check
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the row as a JSON-serializable dict"""
+        return {"connected": self.connected, "last_check": self.last_check}
+
 
 class SocialMediaServer:
     """
@@ -61,20 +95,18 @@ class SocialMediaServer:
         self.server = Server("social-media-server")
         self.logger = logging.getLogger(__name__)
 
-        # Initialize API clients
-        self.twitter_client = None
-        self.instagram_client = None
-        self.linkedin_client = None
-        self.facebook_client = None
-        self.youtube_client = None
+        # API clients keyed by platform, populated for configured platforms
+        self._clients: Dict[str, Any] = {}
+
+        # Shared initialize_platform_clients task; created on first use
+        self._init_task: Optional[asyncio.Task] = None
+
+        # In-flight analytics requests keyed by (platform, post_id, date_range)
+        self._analytics_inflight: Dict[Tuple, asyncio.Task] = {}
 
         # Platform connection status
         self.platform_status = {
-            "twitter": {"connected": False, "last_check": None},
-            "instagram": {"connected": False, "last_check": None},
-            "linkedin": {"connected": False, "last_check": None},
-            "facebook": {"connected": False, "last_check": None},
-            "youtube": {"connected": False, "last_check": None}
+            platform: PlatformStatus() for platform in _PLATFORMS
         }
 
     async def initialize_platform_clients(self):
@@ -84,28 +116,25 @@ class SocialMediaServer:
             credentials = await self._load_platform_credentials()
 
             # Initialize each platform client
-            if credentials.get("twitter"):
-                self.twitter_client = TwitterClient(credentials["twitter"])
-                await self._check_platform_connection("twitter")
+            for platform, client_cls in _PLATFORM_CTORS.items():
+                if credentials.get(platform):
+                    self._clients[platform] = client_cls(credentials[platform])
 
-            if credentials.get("instagram"):
-                self.instagram_client = InstagramClient(credentials["instagram"])
-                await self._check_platform_connection("instagram")
-
-            if credentials.get("linkedin"):
-                self.linkedin_client = LinkedInClient(credentials["linkedin"])
-                await self._check_platform_connection("linkedin")
-
-            if credentials.get("facebook"):
-                self.facebook_client = FacebookClient(credentials["facebook"])
-                await self._check_platform_connection("facebook")
-
-            if credentials.get("youtube"):
-                self.youtube_client = YouTubeClient(credentials["youtube"])
-                await self._check_platform_connection("youtube")
+            # Verify the configured connections concurrently
+            await asyncio.gather(*(
+                self._check_platform_connection(platform)
+                for platform in self._clients
+            ))
 
         except Exception as e:
-            self.logger.error(f"Error initializing platform clients: {str(e)}")
+            self.logger.error("Error initializing platform clients: %s", e)
+
+    async def ensure_initialized(self):
+        """Initialize platform clients exactly once, even under concurrent calls"""
+        if self._init_task is None or self._init_task.cancelled():
+            self._init_task = asyncio.ensure_future(self.initialize_platform_clients())
+        # Shield the shared task so a cancelled caller does not abort it for others
+        await asyncio.shield(self._init_task)
 
     async def _load_platform_credentials(self) -> Dict[str, Any]:
         """Load platform credentials from secure storage"""
@@ -116,22 +145,36 @@ class SocialMediaServer:
     async def _check_platform_connection(self, platform: str):
         """Check if platform connection is valid and update status"""
         try:
-            client = getattr(self, f"{platform}_client")
+            client = self._clients.get(platform)
             if client:
                 is_connected = await client.verify_connection()
-                self.platform_status[platform]["connected"] = is_connected
-                self.platform_status[platform]["last_check"] = datetime.now().isoformat()
+                status = self.platform_status[platform]
+                status.connected = is_connected
+                status.last_check = datetime.now().isoformat()
 
         except Exception as e:
-            self.logger.error(f"Error checking {platform} connection: {str(e)}")
-            self.platform_status[platform]["connected"] = False
+            self.logger.error("Error checking %s connection: %s", platform, e)
+            self.platform_status[platform].connected = False
+
+    @staticmethod
+    def _unsupported_platform(platform: str, timestamp: str) -> Dict[str, Any]:
+        """Build the error result for a platform this server does not support"""
+        return {
+            "success": False,
+            "platform": platform,
+            "error": f"Unsupported platform: {platform}",
+            "timestamp": timestamp
+        }
 
     # MCP Tool Definitions
 
     async def get_platform_status(self) -> Dict[str, Any]:
         """Get current status of all social media platform connections"""
         return {
-            "platform_status": self.platform_status,
+            "platform_status": {
+                platform: status.to_dict()
+                for platform, status in self.platform_status.items()
+            },
             "timestamp": datetime.now().isoformat()
         }
 
@@ -146,12 +189,16 @@ class SocialMediaServer:
         Returns:
             Posting result with post ID and status
         """
+        timestamp = datetime.now().isoformat()
+        if platform not in _PLATFORM_SET:
+            return self._unsupported_platform(platform, timestamp)
+
         try:
-            client = getattr(self, f"{platform}_client")
+            client = self._clients.get(platform)
             if not client:
                 raise ValueError(f"{platform} client not initialized")
 
-            if not self.platform_status[platform]["connected"]:
+            if not self.platform_status[platform].connected:
                 raise ValueError(f"{platform} platform not connected")
 
             # Post content using appropriate client
@@ -162,16 +209,16 @@ class SocialMediaServer:
                 "platform": platform,
                 "post_id": result.get("post_id"),
                 "url": result.get("url"),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
         except Exception as e:
-            self.logger.error(f"Error posting to {platform}: {str(e)}")
+            self.logger.error("Error posting to %s: %s", platform, e)
             return {
                 "success": False,
                 "platform": platform,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
     async def get_analytics(self, platform: str, post_id: Optional[str] = None,
@@ -187,27 +234,48 @@ class SocialMediaServer:
         Returns:
             Analytics data
         """
+        timestamp = datetime.now().isoformat()
+        if platform not in _PLATFORM_SET:
+            return self._unsupported_platform(platform, timestamp)
+
         try:
-            client = getattr(self, f"{platform}_client")
+            client = self._clients.get(platform)
             if not client:
                 raise ValueError(f"{platform} client not initialized")
 
-            analytics = await client.get_analytics(post_id, date_range)
+            # Share one upstream request among concurrent identical queries
+            try:
+                key = (platform, post_id, tuple(sorted(date_range.items())) if date_range else ())
+                hash(key)
+            except TypeError:
+                # Arguments that cannot form a key are passed through uncoalesced
+                key = None
+
+            if key is None:
+                analytics = await client.get_analytics(post_id, date_range)
+            else:
+                task = self._analytics_inflight.get(key)
+                if task is None:
+                    task = asyncio.create_task(client.get_analytics(post_id, date_range))
+                    self._analytics_inflight[key] = task
+                    task.add_done_callback(lambda _: self._analytics_inflight.pop(key, None))
+
+                analytics = await asyncio.shield(task)
 
             return {
                 "success": True,
                 "platform": platform,
                 "analytics": analytics,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
         except Exception as e:
-            self.logger.error(f"Error getting {platform} analytics: {str(e)}")
+            self.logger.error("Error getting %s analytics: %s", platform, e)
             return {
                 "success": False,
                 "platform": platform,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
     async def upload_media(self, platform: str, media_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -221,8 +289,12 @@ class SocialMediaServer:
         Returns:
             Upload result with media ID
         """
+        timestamp = datetime.now().isoformat()
+        if platform not in _PLATFORM_SET:
+            return self._unsupported_platform(platform, timestamp)
+
         try:
-            client = getattr(self, f"{platform}_client")
+            client = self._clients.get(platform)
             if not client:
                 raise ValueError(f"{platform} client not initialized")
 
@@ -233,16 +305,16 @@ class SocialMediaServer:
                 "platform": platform,
                 "media_id": result.get("media_id"),
                 "url": result.get("url"),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
         except Exception as e:
-            self.logger.error(f"Error uploading media to {platform}: {str(e)}")
+            self.logger.error("Error uploading media to %s: %s", platform, e)
             return {
                 "success": False,
                 "platform": platform,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
     async def schedule_post(self, platform: str, content: Dict[str, Any],
@@ -258,16 +330,23 @@ class SocialMediaServer:
         Returns:
             Scheduling result
         """
+        now = datetime.now()
+        timestamp = now.isoformat()
+
         try:
             # Validate scheduled time
-            scheduled_dt = datetime.fromisoformat(scheduled_time.replace('Z', '+00:00'))
+            iso_time = scheduled_time
+            if iso_time.endswith('Z'):
+                iso_time = iso_time[:-1] + '+00:00'
+            scheduled_dt = datetime.fromisoformat(iso_time)
 
-            if scheduled_dt <= datetime.now(scheduled_dt.tzinfo):
+            # Compare against the timestamp already taken for this call
+            if scheduled_dt <= (now if scheduled_dt.tzinfo is None else now.astimezone()):
                 raise ValueError("Scheduled time must be in the future")
 
             # Store in scheduling queue (would integrate with database)
             schedule_result = {
-                "schedule_id": f"schedule_{platform}_{int(datetime.now().timestamp())}",
+                "schedule_id": f"schedule_{platform}_{int(now.timestamp())}",
                 "platform": platform,
                 "scheduled_time": scheduled_time,
                 "content_preview": content.get("text", "")[:100] + "...",
@@ -277,16 +356,16 @@ class SocialMediaServer:
             return {
                 "success": True,
                 "schedule_result": schedule_result,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
         except Exception as e:
-            self.logger.error(f"Error scheduling post for {platform}: {str(e)}")
+            self.logger.error("Error scheduling post for %s: %s", platform, e)
             return {
                 "success": False,
                 "platform": platform,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
     async def get_content_suggestions(self, platform: str, topic: str) -> Dict[str, Any]:
@@ -300,6 +379,8 @@ class SocialMediaServer:
         Returns:
             Content suggestions
         """
+        timestamp = datetime.now().isoformat()
+
         try:
             # This would use AI to generate content suggestions
             # For now, return basic structure
@@ -321,51 +402,72 @@ class SocialMediaServer:
             return {
                 "success": True,
                 "suggestions": suggestions,
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
         except Exception as e:
-            self.logger.error(f"Error getting content suggestions: {str(e)}")
+            self.logger.error("Error getting content suggestions: %s", e)
             return {
                 "success": False,
                 "error": str(e),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": timestamp
             }
 
 
+def _to_text_content(result: Dict[str, Any]) -> List[TextContent]:
+    """Wrap a tool result as indented JSON text, using orjson when installed"""
+    # The two encoders differ on floats: orjson writes 1e16 where json writes
+    # 1e+16, and orjson turns NaN/Infinity into null
+    if ORJSON_AVAILABLE:
+        try:
+            text = orjson.dumps(
+                result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+            return [TextContent(type="text", text=text)]
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, which json handles
+            pass
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    return [TextContent(type="text", text=text)]
+
+
+# Shared server instance, initialized once and reused by every tool handler
+_server: Optional[SocialMediaServer] = None
+
+
+async def _get_server() -> SocialMediaServer:
+    """Return the shared SocialMediaServer, initializing it on first use"""
+    global _server
+    if _server is None:
+        _server = SocialMediaServer()
+    await _server.ensure_initialized()
+    return _server
+
+
 # MCP Server Tool Registration
 async def handle_get_platform_status(arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle get_platform_status tool call"""
-    server = SocialMediaServer()
-    await server.initialize_platform_clients()
+    server = await _get_server()
     result = await server.get_platform_status()
 
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2)
-    )]
+    return _to_text_content(result)
 
 
 async def handle_post_content(arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle post_content tool call"""
-    server = SocialMediaServer()
-    await server.initialize_platform_clients()
+    server = await _get_server()
 
     platform = arguments.get("platform", "")
     content = arguments.get("content", {})
 
     result = await server.post_content(platform, content)
 
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2)
-    )]
+    return _to_text_content(result)
 
 
 async def handle_get_analytics(arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle get_analytics tool call"""
-    server = SocialMediaServer()
-    await server.initialize_platform_clients()
+    server = await _get_server()
 
     platform = arguments.get("platform", "")
     post_id = arguments.get("post_id")
@@ -373,16 +475,12 @@ async def handle_get_analytics(arguments: Dict[str, Any]) -> List[TextContent]:
 
     result = await server.get_analytics(platform, post_id, date_range)
 
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2)
-    )]
+    return _to_text_content(result)
 
 
 async def handle_schedule_post(arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle schedule_post tool call"""
-    server = SocialMediaServer()
-    await server.initialize_platform_clients()
+    server = await _get_server()
 
     platform = arguments.get("platform", "")
     content = arguments.get("content", {})
@@ -390,30 +488,30 @@ async def handle_schedule_post(arguments: Dict[str, Any]) -> List[TextContent]:
 
     result = await server.schedule_post(platform, content, scheduled_time)
 
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2)
-    )]
+    return _to_text_content(result)
 
 
 async def handle_get_content_suggestions(arguments: Dict[str, Any]) -> List[TextContent]:
     """Handle get_content_suggestions tool call"""
-    server = SocialMediaServer()
-    await server.initialize_platform_clients()
+    server = await _get_server()
 
     platform = arguments.get("platform", "")
     topic = arguments.get("topic", "")
 
     result = await server.get_content_suggestions(platform, topic)
 
-    return [TextContent(
-        type="text",
-        text=json.dumps(result, indent=2)
-    )]
+    return _to_text_content(result)
 
 
-# Tool definitions for MCP
-SOCIAL_MEDIA_TOOLS = [
+# Platform argument schema shared by the tool definitions below
+_PLATFORM_PROPERTY = {
+    "type": "string",
+    "enum": _PLATFORMS,
+    "description": "Target social media platform"
+}
+
+# Tool definitions for MCP, built once at import
+SOCIAL_MEDIA_TOOLS = (
     Tool(
         name="get_platform_status",
         description="Get current status of all social media platform connections",
@@ -429,11 +527,7 @@ SOCIAL_MEDIA_TOOLS = [
         inputSchema={
             "type": "object",
             "properties": {
-                "platform": {
-                    "type": "string",
-                    "enum": ["twitter", "instagram", "linkedin", "facebook", "youtube"],
-                    "description": "Target social media platform"
-                },
+                "platform": _PLATFORM_PROPERTY,
                 "content": {
                     "type": "object",
                     "description": "Content data including text, media, and metadata",
@@ -454,11 +548,7 @@ SOCIAL_MEDIA_TOOLS = [
         inputSchema={
             "type": "object",
             "properties": {
-                "platform": {
-                    "type": "string",
-                    "enum": ["twitter", "instagram", "linkedin", "facebook", "youtube"],
-                    "description": "Target social media platform"
-                },
+                "platform": _PLATFORM_PROPERTY,
                 "post_id": {"type": "string", "description": "Specific post ID (optional)"},
                 "date_range": {
                     "type": "object",
@@ -478,11 +568,7 @@ SOCIAL_MEDIA_TOOLS = [
         inputSchema={
             "type": "object",
             "properties": {
-                "platform": {
-                    "type": "string",
-                    "enum": ["twitter", "instagram", "linkedin", "facebook", "youtube"],
-                    "description": "Target social media platform"
-                },
+                "platform": _PLATFORM_PROPERTY,
                 "content": {
                     "type": "object",
                     "description": "Post content data",
@@ -505,11 +591,7 @@ SOCIAL_MEDIA_TOOLS = [
         inputSchema={
             "type": "object",
             "properties": {
-                "platform": {
-                    "type": "string",
-                    "enum": ["twitter", "instagram", "linkedin", "facebook", "youtube"],
-                    "description": "Target social media platform"
-                },
+                "platform": _PLATFORM_PROPERTY,
                 "topic": {
                     "type": "string",
                     "description": "Content topic or theme"
@@ -518,7 +600,7 @@ SOCIAL_MEDIA_TOOLS = [
             "required": ["platform", "topic"]
         }
     )
-]
+)
 
 
 if __name__ == "__main__":
@@ -15,22 +15,33 @@ Contains the following submodules:
 __version__ = "1.0.0"
 __author__ = "DeepCode Team"
 
-# Import main components
-from .layout import main_layout
-from .components import display_header, display_features, display_status
-from .handlers import initialize_session_state
-from .styles import get_main_styles
-
-# Import application main function
-try:
-    from .streamlit_app import main as streamlit_main
-except ImportError:
-    # Fallback to absolute import if relative import fails
-    import sys
-    import os
-
-    sys.path.insert(0, os.path.dirname(__file__))
-    from streamlit_app import main as streamlit_main
+import importlib
+
+# Exported names and the submodule/attribute they come from. Submodules pull in
+# streamlit and the agent workflows, so they are imported on first access only.
+_LAZY_EXPORTS = {
+    "main_layout": (".layout", "main_layout"),
+    "display_header": (".components", "display_header"),
+    "display_features": (".components", "display_features"),
+    "display_status": (".components", "display_status"),
+    "initialize_session_state": (".handlers", "initialize_session_state"),
+    "get_main_styles": (".styles", "get_main_styles"),
+    "streamlit_main": (".streamlit_app", "main"),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module_name, attr = _LAZY_EXPORTS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
+
 
 __all__ = [
     "main_layout",
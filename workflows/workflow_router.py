@@ -10,8 +10,9 @@ The router analyzes input data to automatically detect the appropriate workflow
 or uses explicit workflow mode specifications when provided.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 import logging
+import re
 
 
 class WorkflowRouter:
@@ -61,6 +62,44 @@ class WorkflowRouter:
             '.jpg', '.jpeg', '.png', '.gif', '.mp4', '.mov', '.avi',
             '.csv', '.xlsx', '.json'  # For analytics data
         ]
+        
+        # Precompiled keyword matchers (one regex pass per workflow type)
+        self._deepcode_matcher = self._compile_indicators(self.deepcode_indicators)
+        self._zenalto_matcher = self._compile_indicators(self.zenalto_indicators)
+    
+    @staticmethod
+    def _compile_indicators(indicators: List[str]) -> Tuple[re.Pattern, Dict[str, frozenset]]:
+        """
+        Compile a list of indicator keywords into a single substring regex.
+        
+        Args:
+            indicators: Keywords or phrases to match
+            
+        Returns:
+            Compiled pattern and a map from each indicator to every indicator
+            it contains. The lookahead finds the longest indicator starting at
+            each position; the map adds shorter ones found inside it
+            (e.g. 'implement' inside 'implementation').
+        """
+        alternation = '|'.join(
+            re.escape(indicator)
+            for indicator in sorted(indicators, key=len, reverse=True)
+        )
+        contained = {
+            indicator: frozenset(other for other in indicators if other in indicator)
+            for indicator in indicators
+        }
+        return re.compile(r'(?=(' + alternation + r'))'), contained
+    
+    @staticmethod
+    def _count_indicators(matcher: Tuple[re.Pattern, Dict[str, frozenset]],
+                          request_text: str) -> int:
+        """Count the distinct indicators that occur as substrings of the text."""
+        pattern, contained = matcher
+        found = set()
+        for match in set(pattern.findall(request_text)):
+            found |= contained[match]
+        return len(found)
     
     async def detect_workflow_type(self, input_data: Dict[str, Any]) -> str:
         """
@@ -177,10 +216,9 @@ class WorkflowRouter:
         Returns:
             Dict with deepcode and zenalto scores based on content analysis
         """
-        deepcode_score = sum(1 for indicator in self.deepcode_indicators 
-                           if indicator in request_text)
-        zenalto_score = sum(1 for indicator in self.zenalto_indicators 
-                          if indicator in request_text)
+        # Each distinct indicator contributes at most one point
+        deepcode_score = self._count_indicators(self._deepcode_matcher, request_text)
+        zenalto_score = self._count_indicators(self._zenalto_matcher, request_text)
         
         return {'deepcode': deepcode_score, 'zenalto': zenalto_score}
     